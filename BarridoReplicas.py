@@ -0,0 +1,58 @@
+"""
+Corre réplicas Monte Carlo del modelo con estrategias en paralelo.
+
+Un tick individual tiene dependencias entre agentes, pero las réplicas son
+independientes entre sí (cada InfectionModel es autocontenido), así que se
+reparten tal cual entre procesos con multiprocessing.Pool: escala lineal
+con el número de núcleos.
+"""
+import multiprocessing as mp
+
+import pandas as pd
+
+from VirusConEstrategias import InfectionModel
+
+SIMULATION_STEPS = 150
+
+
+def run_one(args):
+    """
+    Corre una réplica completa y devuelve su historial S/I/R.
+
+    Tiene que ser una función de nivel de módulo para que multiprocessing
+    pueda enviarla (pickle) a los procesos hijos. Ojo: modelos que
+    compartan estado mutable a nivel de módulo romperían este esquema;
+    aquí cada réplica solo toca sus propios arreglos.
+    """
+    seed, params = args
+    model = InfectionModel(seed=seed, max_steps=SIMULATION_STEPS, **params)
+    for _ in range(SIMULATION_STEPS):
+        if not model.running:
+            break
+        model.step()
+    return model.history[:model.tick]
+
+
+if __name__ == "__main__":
+    params = dict(
+        N=200,
+        initial_infected=10,
+        infection_rate=0.25,
+        social_distancing_rate=0.5,
+        quarantine_enabled=True,
+        initial_vaccinated_rate=0.3,
+    )
+    seeds = list(range(8))
+
+    with mp.Pool() as pool:
+        historias = pool.map(run_one, [(s, params) for s in seeds])
+
+    resumen = pd.DataFrame({
+        "semilla": seeds,
+        "pico_infectados": [int(h[:, 1].max()) for h in historias],
+        "recuperados_finales": [int(h[-1, 2]) for h in historias],
+        "duracion": [len(h) for h in historias],
+    })
+
+    print("--- Réplicas en paralelo del Virus con Estrategias ---")
+    print(resumen)
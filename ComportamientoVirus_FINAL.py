@@ -1,6 +1,141 @@
 import mesa
 import mesa.time
+import numpy as np
 import pandas as pd
+from numba import njit, prange
+
+# Códigos enteros de estado: comparar ints es un solo == en C (y habilita
+# bincount y aritmética sin ramas); los nombres quedan solo para mostrar
+S, I, R = 0, 1, 2
+STATE_NAMES = ("Susceptible", "Infected", "Recovered")
+
+
+# --- Kernels del tick compilados con Numba ---
+# Con el estado en arreglos (SoA), el paso completo es un kernel numérico:
+# estas funciones sacan al intérprete de Python del camino caliente.
+
+@njit(cache=True)
+def recover_kernel(states, infection_times, infected_ids, infected_pos,
+                   n_inf, t, recovery_time):
+    """Pasa a Recuperado a los infectados que cumplieron el tiempo.
+
+    Recorre solo la lista de infectados activos (estilo Gillespie): O(#I)
+    en vez de O(N). Los recuperados salen de la lista con swap-pop.
+    Devuelve el nuevo número de infectados.
+    """
+    k = 0
+    while k < n_inf:
+        i = infected_ids[k]
+        if t - infection_times[i] >= recovery_time:
+            states[i] = R
+            n_inf -= 1
+            last = infected_ids[n_inf]
+            infected_ids[k] = last
+            infected_pos[last] = k
+            infected_pos[i] = -1
+            # no avanzar k: hay otro id en esta posición ahora
+        else:
+            k += 1
+    return n_inf
+
+
+@njit(cache=True, parallel=True)
+def move_kernel(pos_idx, neighbors, dirs):
+    """Mueve cada agente a la celda vecina sorteada en dirs."""
+    for i in prange(pos_idx.shape[0]):
+        pos_idx[i] = neighbors[pos_idx[i], dirs[i]]
+
+
+@njit(cache=True)
+def build_cells_kernel(cell_head, agent_next, cell_count, pos_idx):
+    """
+    Reconstruye el índice celda->agentes (listas enlazadas head/next) y el
+    conteo de ocupación por celda en dos pasadas O(N), sin dicts de Python.
+    Los arreglos se reutilizan cada tick.
+    """
+    for c in range(cell_head.shape[0]):
+        cell_head[c] = -1
+        cell_count[c] = 0
+    for i in range(pos_idx.shape[0]):
+        c = pos_idx[i]
+        agent_next[i] = cell_head[c]
+        cell_head[c] = i
+        cell_count[c] += 1
+
+
+@njit(cache=True)
+def collect_cells_kernel(pos_idx, infected_ids, n_inf, cell_stamp, t,
+                         cell_count, cells_buf):
+    """
+    Junta (sin repetir, usando un sello por celda) las celdas que contienen
+    algún infectado, descartando de entrada las celdas con menos de dos
+    ocupantes (ahí no puede haber contagio). Devuelve cuántas celdas
+    candidatas hay en cells_buf.
+    """
+    n_cells = 0
+    for k in range(n_inf):
+        c = pos_idx[infected_ids[k]]
+        if cell_stamp[c] != t:
+            cell_stamp[c] = t
+            if cell_count[c] >= 2:
+                cells_buf[n_cells] = c
+                n_cells += 1
+    return n_cells
+
+
+@njit(cache=True, parallel=True)
+def infect_cells_kernel(states, infection_times, t, prob_table,
+                        cell_head, agent_next, cells_buf, n_cells, draws,
+                        new_mask):
+    """
+    Fase de contagio en paralelo sobre las celdas candidatas. Como el
+    contagio es estrictamente intra-celda, las celdas no comparten escritura
+    alguna (cada agente vive en exactamente una) y el prange es libre de
+    carreras y determinista: con las tiradas pre-sorteadas, el resultado es
+    idéntico al del recorrido serial. Cada celda mixta se resuelve leyendo
+    prob_table[n_inf] (la forma cerrada 1-(1-p)^k precomputada); los
+    contagiados quedan marcados en new_mask para el paso serial que
+    mantiene la lista de infectados.
+    """
+    head = cell_head
+    nxt = agent_next
+    for k in prange(n_cells):
+        c = cells_buf[k]
+        i = head[c]
+        n_inf_cell = 0
+        while i != -1:
+            if states[i] == I:
+                n_inf_cell += 1
+            i = nxt[i]
+        p = prob_table[n_inf_cell]
+        i = head[c]
+        while i != -1:
+            if states[i] == S and draws[i] < p:
+                states[i] = I
+                infection_times[i] = t
+                new_mask[i] = True
+            i = nxt[i]
+
+
+@njit(cache=True)
+def append_new_kernel(new_mask, cells_buf, n_cells, cell_head, agent_next,
+                      infected_ids, infected_pos, n_inf):
+    """
+    Paso serial posterior al contagio paralelo: agrega los contagiados
+    nuevos a la lista de infectados en orden de celda (determinista) y
+    limpia new_mask. Devuelve el nuevo total de infectados.
+    """
+    for k in range(n_cells):
+        i = cell_head[cells_buf[k]]
+        while i != -1:
+            if new_mask[i]:
+                new_mask[i] = False
+                infected_ids[n_inf] = i
+                infected_pos[i] = n_inf
+                n_inf += 1
+            i = agent_next[i]
+    return n_inf
+
 
 class InfectionAgent(mesa.Agent):
     """
@@ -10,51 +145,39 @@ class InfectionAgent(mesa.Agent):
         # Inicialización manual para esquivar la instalación corrupta
         self.unique_id = unique_id
         self.model = model
-        self.pos = None
-        
-        # Atributos específicos de nuestro modelo
-        self.state = "Susceptible"
-        self.infection_time = 0
-
-    def move(self):
-        """Mueve al agente a una celda vecina aleatoria."""
-        possible_steps = self.model.grid.get_neighborhood(
-            self.pos,
-            moore=True,
-            include_center=False
-        )
-        new_position = self.random.choice(possible_steps)
-        self.model.grid.move_agent(self, new_position)
-
-    def update_status(self):
-        """
-        Verifica si el agente debe recuperarse.
-        """
-        if self.state == "Infected":
-            time_infected = self.model.schedule.time - self.infection_time
-            if time_infected >= self.model.recovery_time:
-                self.state = "Recovered"
-
-    def infect(self):
-        """
-        Intenta contagiar a otros agentes en la misma celda.
-        """
-        if self.state == "Infected":
-            cellmates = self.model.grid.get_cell_list_contents([self.pos])
-            if len(cellmates) > 1:
-                for other_agent in cellmates:
-                    if other_agent.state == "Susceptible":
-                        if self.random.random() < self.model.infection_rate:
-                            other_agent.state = "Infected"
-                            other_agent.infection_time = self.model.schedule.time
 
-    def step(self):
-        """
-        Secuencia de acciones del agente en cada paso de tiempo.
-        """
-        self.update_status()
-        self.move()
-        self.infect()
+    # La posición vive como índice plano de celda en model.pos_idx (4
+    # bytes por agente en vez de una tupla (x, y) en el heap); esta
+    # propiedad reconstruye la tupla solo para código de compatibilidad
+    @property
+    def pos(self):
+        return divmod(int(self.model.pos_idx[self.unique_id]),
+                      self.model.height)
+
+    @pos.setter
+    def pos(self, value):
+        if value is not None:
+            x, y = value
+            self.model.pos_idx[self.unique_id] = x * self.model.height + y
+
+    # El estado vive en los arreglos del modelo (layout SoA); estas
+    # propiedades mantienen la interfaz original del agente, en códigos
+    # enteros (S, I, R)
+    @property
+    def state(self):
+        return int(self.model.states[self.unique_id])
+
+    @state.setter
+    def state(self, value):
+        self.model.states[self.unique_id] = value
+
+    @property
+    def infection_time(self):
+        return self.model.infection_times[self.unique_id]
+
+    @infection_time.setter
+    def infection_time(self, value):
+        self.model.infection_times[self.unique_id] = value
 
 
 class InfectionModel(mesa.Model):
@@ -62,42 +185,127 @@ class InfectionModel(mesa.Model):
     El modelo principal que contiene a todos los agentes y el entorno.
     """
     def __init__(self, N=100, width=20, height=20, initial_infected=5,
-                 infection_rate=0.1, recovery_time=15):
-        
+                 infection_rate=0.1, recovery_time=15, seed=None,
+                 max_steps=1000):
+
         super().__init__()
         self.num_agents = N
-        self.grid = mesa.space.MultiGrid(width, height, True)
+        self.width = width
+        self.height = height
         self.schedule = mesa.time.RandomActivation(self)
         self.running = True
         self.infection_rate = infection_rate
         self.recovery_time = recovery_time
+        # Un solo generador NumPy (PCG64) para toda la aleatoriedad del
+        # tick: una llamada en bloque entrega N valores con un bucle en C,
+        # y la semilla hace la corrida reproducible
+        self.rng = np.random.default_rng(seed)
+        # Tabla precomputada de la forma cerrada 1-(1-p)^k: la fase de
+        # contagio indexa por número de infectados en la celda en vez de
+        # evaluar un pow por celda (partial evaluation de p fija)
+        self.prob_table = 1.0 - (1.0 - infection_rate) ** np.arange(N + 1)
+
+        # Estado de todos los agentes en arreglos contiguos (SoA):
+        # contarlos es un solo np.bincount en vez de N comparaciones en Python
+        self.states = np.zeros(self.num_agents, dtype=np.int8)
+        self.infection_times = np.zeros(self.num_agents, dtype=np.int32)
+
+        # Tabla de vecindades de Moore precomputada para la cuadrícula
+        # toroidal: la fila c contiene los 8 vecinos de la celda plana
+        # c = x * height + y. Se calcula una sola vez; move() solo lee filas
+        self.neighbors = np.empty((width * height, 8), dtype=np.int32)
+        offsets = [(dx, dy) for dx in (-1, 0, 1) for dy in (-1, 0, 1)
+                   if (dx, dy) != (0, 0)]
+        for x in range(width):
+            for y in range(height):
+                c = x * height + y
+                for k, (dx, dy) in enumerate(offsets):
+                    self.neighbors[c, k] = ((x + dx) % width) * height + ((y + dy) % height)
+
+        # Posición de cada agente como índice plano de celda; el índice
+        # celda->agentes se lleva como listas enlazadas (head/next) en dos
+        # arreglos planos, sin MultiGrid ni dicts de mesa.space
+        self.pos_idx = np.zeros(self.num_agents, dtype=np.int32)
+        self.cell_head = np.full(width * height, -1, dtype=np.int32)
+        self.agent_next = np.full(self.num_agents, -1, dtype=np.int32)
+        self.cell_count = np.zeros(width * height, dtype=np.int16)
 
         for i in range(self.num_agents):
             agent = InfectionAgent(i, self)
             self.schedule.add(agent)
-            x = self.random.randrange(self.grid.width)
-            y = self.random.randrange(self.grid.height)
-            self.grid.place_agent(agent, (x, y))
+            x = self.random.randrange(width)
+            y = self.random.randrange(height)
+            self.pos_idx[i] = x * height + y
 
             if i < initial_infected:
-                agent.state = "Infected"
+                agent.state = I
                 agent.infection_time = self.schedule.time
-        
-        self.datacollector = mesa.DataCollector(
-            model_reporters={
-                "Susceptible": lambda m: sum(1 for a in m.schedule.agents if a.state == "Susceptible"),
-                "Infected": lambda m: sum(1 for a in m.schedule.agents if a.state == "Infected"),
-                "Recovered": lambda m: sum(1 for a in m.schedule.agents if a.state == "Recovered"),
-            }
-        )
+
+        # Lista explícita de infectados activos (estilo Gillespie): los
+        # kernels iteran solo este prefijo de infected_ids en vez de los N
+        # agentes; infected_pos da la posición de cada id para el swap-pop.
+        # El chequeo de término queda en una comparación entera
+        ids = np.flatnonzero(self.states == I).astype(np.int32)
+        self.infected_ids = np.empty(self.num_agents, dtype=np.int32)
+        self.infected_ids[:ids.size] = ids
+        self.infected_pos = np.full(self.num_agents, -1, dtype=np.int32)
+        self.infected_pos[ids] = np.arange(ids.size, dtype=np.int32)
+        self.infected_count = int(ids.size)
+        # Sello por celda para no procesar dos veces la celda de dos
+        # infectados que comparten posición, búfer de celdas candidatas y
+        # máscara de contagiados nuevos del tick
+        self.cell_stamp = np.full(width * height, -1, dtype=np.int64)
+        self.cells_buf = np.empty(width * height, dtype=np.int32)
+        self.new_mask = np.zeros(self.num_agents, dtype=np.bool_)
+
+        # Historial S/I/R preasignado: cada tick escribe una fila por índice
+        # (nada de listas que crecen ni dispatch de reporters por paso);
+        # el DataFrame se arma una sola vez al final
+        self.history = np.empty((max_steps, 3), dtype=np.int32)
+        self.tick = 0
 
     def step(self):
-        """Avanza la simulación un paso en el tiempo."""
-        self.schedule.step()             # 1. Agentes actúan PRIMERO
-        self.datacollector.collect(self) # 2. Registra datos DESPUÉS
-        
-        if sum(1 for agent in self.schedule.agents if agent.state == "Infected") == 0:
-            self.running = False
+        """Avanza la simulación un paso en el tiempo (kernels Numba)."""
+        t = int(self.schedule.time)
+        # Sin infectados, las fases de recuperación y contagio son no-ops
+        # completas: se saltan enteras
+        if self.infected_count > 0:
+            self.infected_count = recover_kernel(
+                self.states, self.infection_times, self.infected_ids,
+                self.infected_pos, self.infected_count, t,
+                self.recovery_time)
+        dirs = self.rng.integers(0, 8, self.num_agents, dtype=np.int8)
+        move_kernel(self.pos_idx, self.neighbors, dirs)
+        if self.infected_count > 0:
+            draws = self.rng.random(self.num_agents)
+            build_cells_kernel(self.cell_head, self.agent_next,
+                               self.cell_count, self.pos_idx)
+            n_cells = collect_cells_kernel(
+                self.pos_idx, self.infected_ids, self.infected_count,
+                self.cell_stamp, t, self.cell_count, self.cells_buf)
+            infect_cells_kernel(
+                self.states, self.infection_times, t, self.prob_table,
+                self.cell_head, self.agent_next, self.cells_buf, n_cells,
+                draws, self.new_mask)
+            self.infected_count = append_new_kernel(
+                self.new_mask, self.cells_buf, n_cells, self.cell_head,
+                self.agent_next, self.infected_ids, self.infected_pos,
+                self.infected_count)
+        self.schedule.steps += 1
+        self.schedule.time += 1
+        # Registra datos DESPUÉS: un conteo, una fila del historial
+        if self.tick >= self.history.shape[0]:
+            # Duplica la capacidad si la corrida supera max_steps
+            self.history = np.concatenate([self.history,
+                                           np.empty_like(self.history)])
+        self.history[self.tick] = np.bincount(self.states, minlength=3)
+        self.tick += 1
+
+        self.running = self.infected_count > 0
+
+    def get_model_vars_dataframe(self):
+        """Arma el DataFrame de resultados desde el historial preasignado."""
+        return pd.DataFrame(self.history[:self.tick], columns=STATE_NAMES)
 
 
 # --- Bloque para ejecutar la simulación ---
@@ -115,7 +323,7 @@ if __name__ == "__main__":
         else:
             break
 
-    results = model.datacollector.get_model_vars_dataframe()
+    results = model.get_model_vars_dataframe()
 
     pd.set_option('display.max_rows', None)
     
@@ -1,62 +1,100 @@
 import mesa
 import mesa.time
+import numpy as np
 import pandas as pd
 
+# Códigos enteros de estado: comparar ints es un solo == en C (y habilita
+# bincount y aritmética sin ramas); los nombres quedan solo para mostrar
+S, I, R = 0, 1, 2
+STATE_NAMES = ("Susceptible", "Infected", "Recovered")
+
+
 class InfectionAgent(mesa.Agent):
     def __init__(self, unique_id, model):
         self.unique_id = unique_id
         self.model = model
-        self.pos = None
-        self.state = "Susceptible"
-        self.infection_time = 0
-        # Nuevo atributo para la cuarentena
-        self.is_quarantined = False
 
-    def move(self):
+    # La posición vive como índice plano de celda en model.pos_idx (4
+    # bytes por agente en vez de una tupla (x, y) en el heap); esta
+    # propiedad reconstruye la tupla solo para código de compatibilidad
+    @property
+    def pos(self):
+        return divmod(int(self.model.pos_idx[self.unique_id]),
+                      self.model.height)
+
+    @pos.setter
+    def pos(self, value):
+        if value is not None:
+            x, y = value
+            self.model.pos_idx[self.unique_id] = x * self.model.height + y
+
+    # El estado vive en los arreglos del modelo (layout SoA); estas
+    # propiedades mantienen la interfaz original del agente, en códigos
+    # enteros (S, I, R)
+    @property
+    def state(self):
+        return int(self.model.states[self.unique_id])
+
+    @state.setter
+    def state(self, value):
+        # El setter mantiene el conteo incremental de infectados del modelo
+        model = self.model
+        old = model.states[self.unique_id]
+        if old != value:
+            if value == I:
+                model.infected_count += 1
+            elif old == I:
+                model.infected_count -= 1
+            model.states[self.unique_id] = value
+
+    @property
+    def infection_time(self):
+        return self.model.infection_times[self.unique_id]
+
+    @infection_time.setter
+    def infection_time(self, value):
+        self.model.infection_times[self.unique_id] = value
+
+    @property
+    def is_quarantined(self):
+        return bool(self.model.quarantined[self.unique_id])
+
+    @is_quarantined.setter
+    def is_quarantined(self, value):
+        self.model.quarantined[self.unique_id] = value
+
+    def _step_fast(self, t, recovery_time, social_distancing_rate):
+        """
+        Paso del agente con las constantes del tick como parámetros: el
+        modelo las carga una sola vez en locales en vez de que cada agente
+        relea las cadenas self.model.* (un LOAD_ATTR por punto).
+        """
+        model = self.model
+        i = self.unique_id
+
+        # Recuperación
+        if model.states[i] == I and t - model.infection_times[i] >= recovery_time:
+            model.states[i] = R
+            model.infected_count -= 1
+            # Si estaba en cuarentena, ahora puede "salir"
+            if model.quarantined[i]:
+                model.quarantined[i] = False
+                # Lo reubicamos en la cuadrícula
+                x = self.random.randrange(model.width)
+                y = self.random.randrange(model.height)
+                model.pos_idx[i] = x * model.height + y
+
         # --- ESTRATEGIA 1: DISTANCIAMIENTO SOCIAL ---
-        # El agente solo se mueve si supera una probabilidad aleatoria
-        if self.random.random() > self.model.social_distancing_rate:
-            possible_steps = self.model.grid.get_neighborhood(
-                self.pos, moore=True, include_center=False
-            )
-            new_position = self.random.choice(possible_steps)
-            self.model.grid.move_agent(self, new_position)
-
-    def update_status(self):
-        if self.state == "Infected":
-            time_infected = self.model.schedule.time - self.infection_time
-            if time_infected >= self.model.recovery_time:
-                self.state = "Recovered"
-                # Si estaba en cuarentena, ahora puede "salir"
-                if self.is_quarantined:
-                    self.is_quarantined = False
-                    # Lo reubicamos en la cuadrícula
-                    x = self.random.randrange(self.model.grid.width)
-                    y = self.random.randrange(self.model.grid.height)
-                    self.model.grid.place_agent(self, (x, y))
-
-    def infect(self):
-        if self.state == "Infected":
-            cellmates = self.model.grid.get_cell_list_contents([self.pos])
-            for other in cellmates:
-                if other.state == "Susceptible":
-                    if self.random.random() < self.model.infection_rate:
-                        other.state = "Infected"
-                        other.infection_time = self.model.schedule.time
-                        # --- ESTRATEGIA 3: CUARENTENA ---
-                        if self.model.quarantine_enabled:
-                            other.is_quarantined = True
-                            # Lo removemos de la cuadrícula para que no interactúe
-                            self.model.grid.remove_agent(other)
+        # Solo se mueve si supera la probabilidad (tirada pre-sorteada);
+        # un agente en cuarentena no se mueve, solo espera a recuperarse
+        if not model.quarantined[i] and model._move_coin[i] > social_distancing_rate:
+            model.pos_idx[i] = model.neighbors[model.pos_idx[i], model._move_dirs[i]]
 
     def step(self):
-        # Un agente en cuarentena no se mueve ni infecta, solo espera a recuperarse
-        if self.is_quarantined:
-            self.update_status()
-        else:
-            self.update_status()
-            self.move()
-            self.infect()
+        # Camino de compatibilidad; el modelo llama a _step_fast directo
+        model = self.model
+        self._step_fast(model.schedule.time, model.recovery_time,
+                        model.social_distancing_rate)
 
 
 class InfectionModel(mesa.Model):
@@ -65,12 +103,15 @@ class InfectionModel(mesa.Model):
                  # --- NUEVOS PARÁMETROS PARA LAS ESTRATEGIAS ---
                  social_distancing_rate=0.0, # Probabilidad de 0 a 1 de no moverse
                  quarantine_enabled=False,   # Activar/Desactivar cuarentena
-                 initial_vaccinated_rate=0.0 # Porcentaje de 0 a 1 de vacunados iniciales
+                 initial_vaccinated_rate=0.0, # Porcentaje de 0 a 1 de vacunados iniciales
+                 seed=None,
+                 max_steps=1000
                 ):
-        
+
         super().__init__()
         self.num_agents = N
-        self.grid = mesa.space.MultiGrid(width, height, True)
+        self.width = width
+        self.height = height
         self.schedule = mesa.time.RandomActivation(self)
         self.running = True
 
@@ -80,38 +121,147 @@ class InfectionModel(mesa.Model):
         self.social_distancing_rate = social_distancing_rate
         self.quarantine_enabled = quarantine_enabled
 
-        # Creación de agentes
-        for i in range(self.num_agents):
-            agent = InfectionAgent(i, self)
-            
-            # --- ESTRATEGIA 4: VACUNACIÓN ---
-            # Algunos agentes empiezan como "Recuperados" (inmunes)
-            if self.random.random() < initial_vaccinated_rate:
-                agent.state = "Recovered"
-            
-            self.schedule.add(agent)
-            x = self.random.randrange(self.grid.width)
-            y = self.random.randrange(self.grid.height)
-            self.grid.place_agent(agent, (x, y))
-
-            # Infectar agentes (solo si no fueron vacunados)
-            if agent.state == "Susceptible" and i < (initial_infected + int(N*initial_vaccinated_rate)):
-                agent.state = "Infected"
-                agent.infection_time = self.schedule.time
-
-        self.datacollector = mesa.DataCollector(
-            model_reporters={
-                "Susceptible": lambda m: sum(1 for a in m.schedule.agents if a.state == "Susceptible"),
-                "Infected": lambda m: sum(1 for a in m.schedule.agents if a.state == "Infected"),
-                "Recovered": lambda m: sum(1 for a in m.schedule.agents if a.state == "Recovered"),
-            }
+        # Estado de todos los agentes en arreglos contiguos (SoA):
+        # contarlos es un solo np.bincount en vez de N comparaciones en Python
+        self.states = np.zeros(self.num_agents, dtype=np.int8)
+        self.infection_times = np.zeros(self.num_agents, dtype=np.int32)
+        # Marca de cuarentena por agente: en vez de sacarlos físicamente de
+        # una cuadrícula, los agentes en cuarentena se filtran con esta
+        # máscara en la fase de contagio (su pos_idx queda congelado)
+        self.quarantined = np.zeros(self.num_agents, dtype=bool)
+        # Un solo generador NumPy (PCG64) para toda la aleatoriedad del
+        # tick: una llamada en bloque entrega N valores con un bucle en C,
+        # y la semilla hace la corrida reproducible
+        self.rng = np.random.default_rng(seed)
+        # Tabla precomputada de la forma cerrada 1-(1-p)^k: la fase de
+        # contagio indexa por número de infectados en la celda en vez de
+        # evaluar un pow por celda (partial evaluation de p fija)
+        self.prob_table = 1.0 - (1.0 - infection_rate) ** np.arange(N + 1)
+
+        # Tabla de vecindades de Moore precomputada para la cuadrícula
+        # toroidal: la fila c contiene los 8 vecinos de la celda plana
+        # c = x * height + y. Se calcula una sola vez; move() solo lee filas
+        self.neighbors = np.empty((width * height, 8), dtype=np.int32)
+        offsets = [(dx, dy) for dx in (-1, 0, 1) for dy in (-1, 0, 1)
+                   if (dx, dy) != (0, 0)]
+        for x in range(width):
+            for y in range(height):
+                c = x * height + y
+                for k, (dx, dy) in enumerate(offsets):
+                    self.neighbors[c, k] = ((x + dx) % width) * height + ((y + dy) % height)
+
+        # Posición de cada agente como índice plano de celda
+        self.pos_idx = np.zeros(self.num_agents, dtype=np.int32)
+
+        # --- ESTRATEGIA 4: VACUNACIÓN ---
+        # Una sola tirada en bloque decide quiénes empiezan inmunes
+        vacc_mask = self.rng.random(self.num_agents) < initial_vaccinated_rate
+        self.states[vacc_mask] = R
+
+        # Infectar agentes (solo si no fueron vacunados): los primeros
+        # initial_infected susceptibles arrancan infectados
+        sus_ids = np.flatnonzero(self.states == S)[:initial_infected]
+        self.states[sus_ids] = I
+        self.infection_times[sus_ids] = 0
+        # Conteo incremental de infectados: lo mantienen el setter de state
+        # y la fase de contagio; el chequeo de término es una comparación
+        self.infected_count = int(sus_ids.size)
+
+        # Posiciones iniciales, también en bloque
+        self.pos_idx[:] = (
+            self.rng.integers(0, width, self.num_agents, dtype=np.int32) * height
+            + self.rng.integers(0, height, self.num_agents, dtype=np.int32)
         )
 
+        # Creación de agentes; el modelo guarda su propia lista para el
+        # bucle caliente (sin depender de los internos del scheduler)
+        self.agent_list = [InfectionAgent(i, self) for i in range(self.num_agents)]
+        for agent in self.agent_list:
+            self.schedule.add(agent)
+
+        # Historial S/I/R preasignado: cada tick escribe una fila por índice
+        # (nada de listas que crecen ni dispatch de reporters por paso);
+        # el DataFrame se arma una sola vez al final
+        self.history = np.empty((max_steps, 3), dtype=np.int32)
+        self.tick = 0
+
+    def _infect_all(self, t):
+        """
+        Fase de contagio vectorizada: agrupa a los agentes activos por celda
+        y sortea todos los contagios de la celda con una sola tirada en
+        bloque, en vez de una llamada a random() por cada par. Recibe el
+        tiempo del tick (antes del incremento del reloj) para estampar
+        infection_times igual que el modelo base.
+        """
+        if self.infected_count == 0:
+            return
+        active = ~self.quarantined
+        infected = (self.states == I) & active
+        if not infected.any():
+            return
+        cand = np.flatnonzero(active)
+        # Ocupación por celda: descarta de entrada a quienes están solos en
+        # su celda (ahí no puede haber contagio) antes de ordenar
+        cell_count = np.bincount(self.pos_idx[cand],
+                                 minlength=self.width * self.height)
+        cand = cand[cell_count[self.pos_idx[cand]] >= 2]
+        if cand.size == 0:
+            return
+        order = cand[np.argsort(self.pos_idx[cand], kind="stable")]
+        _, starts, counts = np.unique(self.pos_idx[order],
+                                      return_index=True, return_counts=True)
+        for start, count in zip(starts, counts):
+            if count < 2:
+                continue
+            ids = order[start:start + count]
+            n_inf = int(infected[ids].sum())
+            if n_inf == 0:
+                continue
+            sus_ids = ids[self.states[ids] == S]
+            if sus_ids.size == 0:
+                continue
+            # Probabilidad de contagiarse con n_inf infectados en la celda
+            # (forma cerrada precomputada en prob_table)
+            p = self.prob_table[n_inf]
+            new_ids = sus_ids[self.rng.random(sus_ids.size) < p]
+            self.states[new_ids] = I
+            self.infection_times[new_ids] = t
+            self.infected_count += int(new_ids.size)
+            # --- ESTRATEGIA 3: CUARENTENA ---
+            # La máscara los excluye de la fase de contagio; no hace falta
+            # removerlos de ninguna estructura
+            if self.quarantine_enabled:
+                self.quarantined[new_ids] = True
+
     def step(self):
-        self.schedule.step()
-        self.datacollector.collect(self)
-        if sum(1 for a in self.schedule.agents if a.state == "Infected") == 0:
-            self.running = False
+        # Sortea en bloque toda la aleatoriedad de movimiento del tick
+        self._move_dirs = self.rng.integers(0, 8, self.num_agents, dtype=np.int8)
+        self._move_coin = self.rng.random(self.num_agents, dtype=np.float32)
+        # Bucle de agentes con las constantes del tick en locales, pasadas
+        # una sola vez a _step_fast en vez de releerse por agente
+        t = self.schedule.time
+        rec = self.recovery_time
+        sdr = self.social_distancing_rate
+        # El orden de activación sale de una sola permutación vectorizada
+        # en vez del Fisher-Yates por elemento de random.shuffle
+        agents = self.agent_list
+        for i in self.rng.permutation(self.num_agents).tolist():
+            agents[i]._step_fast(t, rec, sdr)
+        self.schedule.steps += 1
+        self.schedule.time += 1
+        self._infect_all(t)
+        # Un conteo, una fila del historial
+        if self.tick >= self.history.shape[0]:
+            # Duplica la capacidad si la corrida supera max_steps
+            self.history = np.concatenate([self.history,
+                                           np.empty_like(self.history)])
+        self.history[self.tick] = np.bincount(self.states, minlength=3)
+        self.tick += 1
+        self.running = self.infected_count > 0
+
+    def get_model_vars_dataframe(self):
+        """Arma el DataFrame de resultados desde el historial preasignado."""
+        return pd.DataFrame(self.history[:self.tick], columns=STATE_NAMES)
 
 
 # --- Bloque para ejecutar la simulación ---
@@ -135,7 +285,7 @@ if __name__ == "__main__":
         else:
             break
 
-    results = model.datacollector.get_model_vars_dataframe()
+    results = model.get_model_vars_dataframe()
     pd.set_option('display.max_rows', None)
     
     print("--- Resultados de la Simulación del Virus con Estrategias ---")
@@ -8,6 +8,7 @@ Objects for handling simulation time.
 from __future__ import annotations
 
 from collections.abc import Iterator
+from operator import methodcaller
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
@@ -30,7 +31,16 @@ class BaseScheduler:
         self.model = model
         self.steps = 0
         self.time = 0.0
-        self._agents: dict[int, Any] = {}
+        # Agents are stored in a plain list (shuffled/iterated directly);
+        # the id -> index mapping exists only to support O(1) removal.
+        self._agents_list: list[Any] = []
+        self._id_to_idx: dict[int, int] = {}
+        # Set once an agent has ever been removed; lets hot loops skip the
+        # per-agent membership check in the common no-removal case.
+        self._any_removals = False
+        # Cached copy handed out by the ``agents`` property; invalidated
+        # by add/remove so repeated accesses don't re-materialize the list.
+        self._agents_list_cache: list[Any] | None = None
 
     def add(self, agent: Any) -> None:
         """Add an Agent object to the schedule.
@@ -40,21 +50,40 @@ class BaseScheduler:
             have a ``unique_id`` property.
 
         """
-        if agent.unique_id in self._agents:
+        if agent.unique_id in self._id_to_idx:
             raise Exception(
                 f"Agent with unique id {agent.unique_id!r} already added."
             )
 
-        self._agents[agent.unique_id] = agent
+        self._id_to_idx[agent.unique_id] = len(self._agents_list)
+        self._agents_list.append(agent)
+        self._agents_list_cache = None
 
     def remove(self, agent: Any) -> None:
         """Remove all instances of a given agent from the schedule.
 
+        Swaps the agent with the last element and pops, so removal is O(1)
+        instead of shifting the tail of the list.
+
         Args:
             agent: An agent object.
 
         """
-        del self._agents[agent.unique_id]
+        idx = self._id_to_idx[agent.unique_id]
+        if self._agents_list[idx] is not agent:
+            # In-place shuffles (RandomActivation) leave the index map
+            # stale; rebuild it lazily here rather than on every shuffle.
+            self._id_to_idx = {
+                a.unique_id: i for i, a in enumerate(self._agents_list)
+            }
+            idx = self._id_to_idx[agent.unique_id]
+        del self._id_to_idx[agent.unique_id]
+        last = self._agents_list.pop()
+        if idx < len(self._agents_list):
+            self._agents_list[idx] = last
+            self._id_to_idx[last.unique_id] = idx
+        self._any_removals = True
+        self._agents_list_cache = None
 
     def step(self) -> None:
         """Execute the step of all the agents, one at a time."""
@@ -65,12 +94,20 @@ class BaseScheduler:
 
     def get_agent_count(self) -> int:
         """Returns the current number of agents in the queue."""
-        return len(self._agents)
+        return len(self._agents_list)
 
     @property
     def agents(self) -> list[Any]:
-        """Return a list of the agents in the scheduler."""
-        return list(self._agents.values())
+        """Return a list of the agents in the scheduler.
+
+        The list is cached between add/remove calls, so reading it several
+        times per step (one pass per data reporter, say) costs one
+        materialization instead of one per access.
+        """
+        cache = self._agents_list_cache
+        if cache is None:
+            cache = self._agents_list_cache = list(self._agents_list)
+        return cache
 
     def agent_buffer(self, shuffled: bool = False) -> Iterator[Any]:
         """Simple generator that yields the agents while handling agent removal
@@ -80,13 +117,13 @@ class BaseScheduler:
             shuffled: If True, yield the agents in shuffled order.
 
         """
-        agent_keys = list(self._agents.keys())
+        agents = list(self._agents_list)
         if shuffled:
-            self.model.random.shuffle(agent_keys)
+            self.model.random.shuffle(agents)
 
-        for key in agent_keys:
-            if key in self._agents:
-                yield self._agents[key]
+        for agent in agents:
+            if agent.unique_id in self._id_to_idx:
+                yield agent
 
 
 class RandomActivation(BaseScheduler):
@@ -101,9 +138,30 @@ class RandomActivation(BaseScheduler):
         """Executes the step of all agents, one at a time, in
         random order.
 
+        Shuffles a snapshot of the agent list and iterates it directly:
+        no per-agent dict lookups and no generator frames on the hot
+        loop. Agents removed during the step are skipped via the
+        ``_any_removals`` flag, so the membership check only costs
+        anything once a removal has actually happened. If the model
+        exposes a NumPy generator as ``model.rng``, the activation order
+        comes from one vectorized ``rng.permutation`` call instead of
+        the per-element Python RNG calls inside ``random.shuffle``.
+
         """
-        for agent in self.agent_buffer(shuffled=True):
-            agent.step()
+        agents = list(self._agents_list)
+        rng = getattr(self.model, "rng", None)
+        if rng is not None:
+            for idx in rng.permutation(len(agents)).tolist():
+                agent = agents[idx]
+                if self._any_removals and agent.unique_id not in self._id_to_idx:
+                    continue  # removed during this step
+                agent.step()
+        else:
+            self.model.random.shuffle(agents)
+            for agent in agents:
+                if self._any_removals and agent.unique_id not in self._id_to_idx:
+                    continue  # removed during this step
+                agent.step()
         self.steps += 1
         self.time += 1
 
@@ -175,15 +233,24 @@ class StagedActivation(BaseScheduler):
         self.shuffle_between_stages = shuffle_between_stages
 
     def step(self) -> None:
-        """Executes all the stages for all agents."""
-        agent_keys = list(self._agents.keys())
+        """Executes all the stages for all agents.
+
+        The stage method is resolved once per stage with
+        ``operator.methodcaller`` instead of a per-agent ``getattr``, and
+        the removal membership check only costs anything once some agent
+        has actually been removed; the flag is re-read per agent so the
+        first removal guards the rest of its own stage immediately.
+        """
+        agents = list(self._agents_list)
         if self.shuffle:
-            self.model.random.shuffle(agent_keys)
+            self.model.random.shuffle(agents)
         for stage in self.stage_list:
-            for agent_key in agent_keys:
-                if agent_key in self._agents:  # agent may have been removed
-                    getattr(self._agents[agent_key], stage)()  # Call stage method
+            call = methodcaller(stage)
+            for agent in agents:
+                if self._any_removals and agent.unique_id not in self._id_to_idx:
+                    continue  # agent may have been removed
+                call(agent)
             if self.shuffle and self.shuffle_between_stages:
-                self.model.random.shuffle(agent_keys)
+                self.model.random.shuffle(agents)
         self.steps += 1
-        self.time += 1
\ No newline at end of file
+        self.time += 1